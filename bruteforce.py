@@ -13,6 +13,12 @@ Qué hace (requisitos del PDF “Algoritmo_DPLL.pdf” - Programa 1):
   * Si es insatisfacible: (False, {})  -> "False" y asignación vacía
   * Si es satisfacible  : (True,  I )  -> "True" y un modelo (diccionario var->bool)
 
+Representación interna (estilo DIMACS):
+- Al cargar la CNF cada variable recibe un entero 1..n; el literal "p" es +id(p) y "~p"
+  es -id(p). Negar es cambiar el signo y la polaridad es el signo (l < 0 ⇔ negado).
+- bruteforce_sat trabaja sobre estos enteros y devuelve {id: bool}; los nombres se
+  recuperan solo al imprimir el modelo (to_dimacs / decode_model).
+
 Cómo se evalúa una CNF:
 - Una **cláusula** (OR) es verdadera si **algún** literal es verdadero.
 - La **fórmula** (AND) es verdadera si **todas** las cláusulas son verdaderas.
@@ -28,6 +34,9 @@ Ejemplos de uso (sin instalar nada):
     # 3) Leer desde stdin (pegar JSON y presionar Ctrl+D/Ctrl+Z):
     python bruteforce.py
 
+    # 4) Opcional: delegar en un solver CDCL externo (requiere `pip install python-sat`):
+    python bruteforce.py --fast --input ejemplos_cnf.json
+
 Formato JSON esperado por la CLI:
 - Una lista de cláusulas; cada cláusula es una lista de literales.
   Ej.: [["p","q"],["~p","r"]]   ó   [["p"],["~p"]]
@@ -36,6 +45,16 @@ Complejidad aproximada:
 - Si hay n variables, se prueban 2^n asignaciones;
   cada verificación evalúa todas las cláusulas y literales dentro de ellas.
 - En notación grande: O( 2^n * (m * k) ), donde m=#cláusulas, k=tamaño promedio de cláusula.
+- Cada cláusula se empaqueta en máscaras de bits (una para literales positivos y otra
+  para negados), de modo que evaluarla cuesta unas pocas operaciones AND/OR sobre enteros
+  en lugar de recorrer sus literales uno por uno.
+- Además, las asignaciones se evalúan por bloques de 2^LANE_BITS (bitslicing): cada bit
+  de un entero representa una asignación distinta del bloque, así que el bucle de Python
+  da 2^(n - LANE_BITS) vueltas en lugar de 2^n.
+- Los bloques se recorren en orden de código Gray (entre uno y el siguiente cambia una
+  sola variable), y solo se actualizan las cláusulas que contienen esa variable.
+- Si hay muchos bloques, el espacio se reparte entre varios procesos fijando las
+  variables más altas (--jobs); el primero que encuentra un modelo detiene al resto.
 
 NOTA: Este programa es independiente del DPLL (Programa 2). Aquí solo resolvemos por fuerza bruta.
 """
@@ -43,9 +62,13 @@ NOTA: Este programa es independiente del DPLL (Programa 2). Aquí solo resolvemo
 from __future__ import annotations
 
 import argparse
-import itertools
+import functools
 import json
-from typing import Dict, Iterable, List, Sequence, Set, Tuple
+import multiprocessing
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import AbstractSet, Dict, Iterable, List, Sequence, Set, Tuple
 
 
 Literal = str               # "p" o "~p"
@@ -53,17 +76,24 @@ Clause = Set[Literal]       # p.ej. {"p", "~q", "r"}
 CNF = List[Clause]          # p.ej. [{"p","q"}, {"~p","r"}]
 Assignment = Dict[str, bool]
 
+Lit = int                   # +v ó -v  (v = 1..n)
+IntClause = AbstractSet[Lit]  # p.ej. {1, -2, 3} (set o frozenset: no se muta)
+IntCNF = List[IntClause]    # p.ej. [{1, 2}, {-1, 3}]
+IntAssignment = Dict[int, bool]
+
 
 # -------------------------------
 # Utilidades sobre literales
 # -------------------------------
 
+@functools.lru_cache(maxsize=None)
 def base_var(lit: Literal) -> str:
     """Devuelve el nombre base de la variable de un literal.
     - base_var("p")  -> "p"
     - base_var("~p") -> "p"
+    Se memoriza y el resultado se interna: cada nombre existe una sola vez en memoria.
     """
-    return lit[1:] if lit.startswith("~") else lit
+    return sys.intern(lit[1:]) if lit.startswith("~") else lit
 
 
 def is_negated(lit: Literal) -> bool:
@@ -71,21 +101,41 @@ def is_negated(lit: Literal) -> bool:
     return lit.startswith("~")
 
 
+def to_dimacs(cnf: CNF) -> Tuple[IntCNF, List[str]]:
+    """Traduce la CNF de strings a enteros estilo DIMACS.
+    Devuelve (cláusulas, var_names) donde var_names[v-1] es el nombre de la variable v.
+    - to_dimacs([{"p","q"}, {"~p","r"}]) -> ([{1, 2}, {-1, 3}], ["p", "q", "r"])
+    """
+    var_names = sorted({base_var(lit) for clause in cnf for lit in clause})
+    index = {name: v for v, name in enumerate(var_names, start=1)}
+    clauses: IntCNF = []
+    for clause in cnf:
+        clauses.append({-index[base_var(l)] if is_negated(l) else index[base_var(l)] for l in clause})
+    return clauses, var_names
+
+
+def decode_model(I: IntAssignment, var_names: Sequence[str]) -> Assignment:
+    """Traduce una asignación sobre ids de variable de vuelta a {nombre: bool}."""
+    return {var_names[v - 1]: val for v, val in I.items()}
+
+
 # -------------------------------
 # Evaluación de CNF
 # -------------------------------
+#
+# Auxiliares de referencia (p.ej. para verificar un modelo): bruteforce_sat no las usa,
+# evalúa por bloques con máscaras de bits (ver sweep_blocks).
 
-def eval_literal(lit: Literal, I: Assignment) -> bool:
+def eval_literal(lit: Lit, I: IntAssignment) -> bool:
     """Evalúa un literal bajo una asignación I.
     Requiere que la variable base exista en I.
-    - "p"  es True  si I["p"] es True
-    - "~p" es True  si I["p"] es False
+    - +v es True si I[v] es True
+    - -v es True si I[v] es False
     """
-    v = I[base_var(lit)]
-    return (not v) if is_negated(lit) else v
+    return I[abs(lit)] ^ (lit < 0)
 
 
-def eval_clause(clause: Clause, I: Assignment) -> bool:
+def eval_clause(clause: IntClause, I: IntAssignment) -> bool:
     """Una cláusula (OR) es verdadera si algún literal es verdadero."""
     # Convención: una cláusula *vacía* es FALSA (no hay literal que la haga verdadera).
     if len(clause) == 0:
@@ -93,7 +143,7 @@ def eval_clause(clause: Clause, I: Assignment) -> bool:
     return any(eval_literal(lit, I) for lit in clause)
 
 
-def eval_cnf(cnf: CNF, I: Assignment) -> bool:
+def eval_cnf(cnf: IntCNF, I: IntAssignment) -> bool:
     """La fórmula CNF (AND de cláusulas) es verdadera si TODAS las cláusulas son verdaderas."""
     return all(eval_clause(c, I) for c in cnf)
 
@@ -102,52 +152,337 @@ def eval_cnf(cnf: CNF, I: Assignment) -> bool:
 # Pre-simplificación ligera (opcional pero útil)
 # -------------------------------
 
-def simplify_cnf(cnf: CNF) -> CNF:
+def simplify_cnf(cnf: IntCNF) -> IntCNF:
     """Realiza limpiezas seguras:
     - Elimina cláusulas tautológicas (contienen p y ~p).
     - Elimina literales duplicados dentro de una cláusula (al ser sets, ya viene sin duplicados).
     - Elimina cláusulas duplicadas.
     Estas transformaciones no cambian la satisfacibilidad.
+    Devuelve las cláusulas como frozensets, ordenadas de la más corta a la más larga: una
+    cláusula de k literales es falsa en 2^-k de las asignaciones, así que las cortas son
+    las que más probablemente anulan un bloque; sweep_blocks parte de este orden al
+    revisar las cláusulas abiertas de cada bloque.
     """
-    simplified: List[Clause] = []
+    # Una sola pasada: cada cláusula se congela UNA vez (frozenset); esa misma clave sirve
+    # para descartar duplicadas, para detectar tautologías y, tal cual, como la cláusula
+    # resultante (nadie la modifica después: solo se recorre y se mide con len).
+    seen: Set[frozenset] = set()
+    by_length: Dict[int, List[IntClause]] = {}
     for clause in cnf:
-        # Si es lista, conviértela a set; si ya es set, cópiala
-        cset = set(clause)
+        key = frozenset(clause)
+        if key in seen:
+            continue  # cláusula duplicada
+        seen.add(key)
         # ¿Tautológica? (contiene variable y su negación)
-        bases = {base_var(l) for l in cset}
-        is_tautology = any((v in bases and ("~" + v) in cset and v in cset)  # (p y ~p explícitos)
-                           or (("~" + v) in cset and v in cset)              # forma estándar
-                           for v in bases)
-        if is_tautology:
+        if any(-l in key for l in key):
             continue  # quitar cláusula tautológica
+        by_length.setdefault(len(key), []).append(key)
 
-        simplified.append(cset)
+    return [c for size in sorted(by_length) for c in by_length[size]]
 
-    # Quitar cláusulas duplicadas (congelándolas)
-    unique = list({frozenset(c) for c in simplified})
-    # Restaurar a sets mutables
-    return [set(fc) for fc in unique]
 
-
-def variables_from_cnf(cnf: CNF) -> List[str]:
-    """Extrae y devuelve la lista ORDENADA de variables presentes en la CNF."""
-    vars_set = {base_var(lit) for clause in cnf for lit in clause}
+def variables_from_cnf(cnf: IntCNF) -> List[int]:
+    """Extrae y devuelve la lista ORDENADA de variables (ids) presentes en la CNF."""
+    vars_set = {abs(lit) for clause in cnf for lit in clause}
     return sorted(vars_set)
 
 
+# -------------------------------
+# Representación por bits (máscaras por cláusula)
+# -------------------------------
+
+def build_clause_masks(cnf: IntCNF, vars_list: Sequence[int]) -> Tuple[List[int], List[int]]:
+    """Empaqueta cada cláusula en dos máscaras de bits sobre el índice de las variables.
+
+    La variable vars_list[j] ocupa el bit j:
+    - pos[i] tiene el bit j encendido si la cláusula i contiene +vars_list[j].
+    - neg[i] tiene el bit j encendido si la cláusula i contiene -vars_list[j].
+    Se usan enteros de Python (precisión arbitraria), así que no hay límite de 64 variables.
+    """
+    index = {v: j for j, v in enumerate(vars_list)}
+    pos: List[int] = []
+    neg: List[int] = []
+    for clause in cnf:
+        p = q = 0
+        for lit in clause:
+            bit = 1 << index[abs(lit)]
+            if lit < 0:
+                q |= bit
+            else:
+                p |= bit
+        pos.append(p)
+        neg.append(q)
+    return pos, neg
+
+
+def unpack_assignment(a: int, vars_list: Sequence[int]) -> IntAssignment:
+    """Convierte una asignación empaquetada en un entero (bit j = valor de vars_list[j])
+    en el diccionario {id: bool}."""
+    return {v: bool((a >> j) & 1) for j, v in enumerate(vars_list)}
+
+
+def build_occur(pos: Sequence[int], neg: Sequence[int], nvars: int) -> Tuple[List[List[int]], List[List[int]]]:
+    """Índices de ocurrencia sobre la CNF empaquetada (ver build_clause_masks).
+
+    occ_pos[j] / occ_neg[j] son los índices de las cláusulas que contienen la variable de
+    bit j (j < nvars; los bits más altos se ignoran) en forma positiva / negada. Se arman
+    recorriendo solo los bits encendidos de cada máscara (O(total de literales)), en lugar
+    de preguntar a cada cláusula por cada variable.
+    """
+    occ_pos: List[List[int]] = [[] for _ in range(nvars)]
+    occ_neg: List[List[int]] = [[] for _ in range(nvars)]
+    keep = (1 << nvars) - 1
+    for occ, masks in ((occ_pos, pos), (occ_neg, neg)):
+        for i, mask in enumerate(masks):
+            mask &= keep
+            while mask:
+                bit = mask & -mask
+                occ[bit.bit_length() - 1].append(i)
+                mask ^= bit
+    return occ_pos, occ_neg
+
+
+# -------------------------------
+# Bitslicing: muchas asignaciones a la vez
+# -------------------------------
+
+# Número de variables "bajas" que se enumeran en paralelo dentro de un bloque:
+# un bloque cubre 2^LANE_BITS asignaciones consecutivas. Los enteros de Python no
+# tienen ancho fijo: un AND/OR entre enteros de 2^14 bits es un solo bucle en C sobre
+# ~550 palabras, así que conviene un bloque mucho más ancho que un registro de 64 o
+# 256 bits (medido: 14 rinde mejor que 6, 8, 10, 12 o 16 en CNFs de 22 a 28 variables).
+LANE_BITS = 14
+
+
+def lane_patterns(k: int) -> List[int]:
+    """Patrones de bitslicing para las k variables bajas de un bloque de 2^k asignaciones.
+
+    El bit t del patrón j vale el bit j de t, es decir, el valor de la variable j en la
+    t-ésima asignación del bloque. Cada patrón se arma con una sola multiplicación (sin
+    recorrer los 2^k bits uno por uno). Para k = 6:
+    - patrón 0 -> 0xAAAA...AA
+    - patrón 1 -> 0xCCCC...CC
+    - patrón 2 -> 0xF0F0...F0, etc.
+    """
+    full = (1 << (1 << k)) - 1
+    patterns: List[int] = []
+    for j in range(k):
+        half = 1 << j
+        period = half << 1
+        unit = ((1 << half) - 1) << half          # 2^j ceros seguidos de 2^j unos
+        # Repetir `unit` a lo largo del bloque: full / (2^period - 1) = 1 0..0 1 0..0 1 ...
+        patterns.append(unit * (full // ((1 << period) - 1)))
+    return patterns
+
+
+def bitslice_low(pos: Sequence[int], neg: Sequence[int], k: int) -> List[int]:
+    """Para cada cláusula, OR de sus literales sobre las k variables bajas de un bloque.
+
+    El resultado no depende del bloque (las variables bajas recorren siempre los mismos
+    2^k valores), así que se calcula una sola vez. El bit t indica si la cláusula queda
+    satisfecha por sus literales bajos en la t-ésima asignación del bloque.
+    """
+    full = (1 << (1 << k)) - 1
+    patterns = lane_patterns(k)
+    occ_pos, occ_neg = build_occur(pos, neg, k)
+    low_ok = [0] * len(pos)
+    for j in range(k):
+        for i in occ_pos[j]:
+            low_ok[i] |= patterns[j]
+        negated = full & ~patterns[j]
+        for i in occ_neg[j]:
+            low_ok[i] |= negated
+    return low_ok
+
+
+# Tras cuántos bloques se reordenan las cláusulas según cuántas veces anularon un bloque.
+REORDER_AFTER = 256
+
+
+def sweep_blocks(low_ok: Sequence[int], hpos: Sequence[int], hneg: Sequence[int],
+                 h: int, k: int, stop=None) -> Tuple[int, int] | None:
+    """Recorre los 2^h bloques (valores de las h variables altas) en orden de código Gray.
+
+    hpos[i] / hneg[i] son las máscaras de la cláusula i sobre las variables altas y low_ok[i]
+    su OR precalculado sobre las k bajas (ver bitslice_low). Las cláusulas satisfechas por
+    las variables altas se llevan como un conjunto de bits (bit i = cláusula i):
+        cubiertas = OR_j ( pos_occ[j] si la variable alta j vale 1, si no neg_occ[j] )
+    y se guarda el OR acumulado desde la variable más alta hacia abajo (suffix[j]).
+    Entre dos bloques consecutivos del código Gray cambia UNA sola variable j, así que solo
+    hay que recalcular suffix[j], ..., suffix[0]; como casi siempre cambia una variable
+    baja, en promedio son ~2 operaciones OR por bloque, sin tocar las demás cláusulas.
+
+    Con las cláusulas abiertas (no cubiertas) del bloque:
+    - si alguna no tiene literales bajos (low_ok == 0), ninguna asignación del bloque sirve;
+    - si no, el AND de sus low_ok da las asignaciones del bloque que satisfacen la CNF.
+      El AND se corta en cuanto da 0, así que conviene revisar primero las cláusulas que
+      más seguido lo anulan: se empieza por las más cortas (orden de simplify_cnf) y tras
+      REORDER_AFTER bloques se reordenan según cuántas veces anuló cada una.
+
+    Si se pasa `stop` (un multiprocessing.Event), se consulta cada STOP_POLL_BLOCKS
+    bloques y, si está activado, se abandona el recorrido devolviendo None.
+
+    Devuelve (bloque, t) de la primera asignación que satisface la CNF, o None.
+    """
+    full = (1 << (1 << k)) - 1
+    m = len(low_ok)
+    all_clauses = (1 << m) - 1
+    occ_pos, occ_neg = build_occur(hpos, hneg, h)
+
+    def index_clauses(order: Sequence[int]) -> Tuple[List[int], List[int], List[int], int]:
+        # El bit r de cada máscara corresponde a la cláusula order[r]: las primeras en
+        # `order` son las primeras que se revisan al hacer el AND de un bloque.
+        rank = [0] * m
+        for r, i in enumerate(order):
+            rank[i] = r
+        low = [low_ok[i] for i in order]
+        pos_occ = [sum(1 << rank[i] for i in occ_pos[j]) for j in range(h)]
+        neg_occ = [sum(1 << rank[i] for i in occ_neg[j]) for j in range(h)]
+        no_low = sum(1 << rank[i] for i in range(m) if not low_ok[i])
+        return low, pos_occ, neg_occ, no_low
+
+    # Orden inicial: el de la CNF (simplify_cnf la deja de la cláusula más corta a la más larga)
+    order = list(range(m))
+    low, pos_occ, neg_occ, no_low = index_clauses(order)
+    kills = [0] * m
+
+    # Bloque inicial: todas las variables altas en False
+    suffix = [0] * (h + 1)
+    for j in range(h - 1, -1, -1):
+        suffix[j] = suffix[j + 1] | neg_occ[j]
+
+    block = 0
+    step = 0
+    while True:
+        open_clauses = all_clauses & ~suffix[0]
+        if not open_clauses & no_low:
+            model_mask = full
+            while open_clauses:
+                bit = open_clauses & -open_clauses
+                r = bit.bit_length() - 1
+                model_mask &= low[r]
+                if not model_mask:
+                    kills[r] += 1
+                    break
+                open_clauses ^= bit
+            if model_mask:
+                # ctz: el bit encendido más bajo es el primer modelo del bloque
+                return block, (model_mask & -model_mask).bit_length() - 1
+
+        step += 1
+        if step >> h:
+            return None
+        if stop is not None and not step % STOP_POLL_BLOCKS and stop.is_set():
+            return None
+
+        if step == REORDER_AFTER:
+            # Reordenamiento en línea (una sola vez): primero las cláusulas que más veces
+            # anularon el bloque hasta ahora; a igualdad, se conserva el orden por longitud.
+            ranked = sorted(range(m), key=lambda r: -kills[r])
+            order = [order[r] for r in ranked]
+            low, pos_occ, neg_occ, no_low = index_clauses(order)
+            for j in range(h - 1, -1, -1):
+                suffix[j] = suffix[j + 1] | (pos_occ[j] if (block >> j) & 1 else neg_occ[j])
+
+        # Código Gray: del paso step-1 al step cambia el bit ctz(step)
+        j = (step & -step).bit_length() - 1
+        block ^= 1 << j
+        for i in range(j, -1, -1):
+            suffix[i] = suffix[i + 1] | (pos_occ[i] if (block >> i) & 1 else neg_occ[i])
+
+
+# -------------------------------
+# Recorrido en paralelo (varios procesos)
+# -------------------------------
+
+# Solo se reparte entre procesos si hay al menos 2^PARALLEL_MIN_HIGH_BITS bloques:
+# con menos, arrancar los procesos cuesta más que recorrerlos en uno solo.
+PARALLEL_MIN_HIGH_BITS = 10
+# Cada cuántos bloques un proceso revisa si otro ya encontró un modelo.
+STOP_POLL_BLOCKS = 1024
+
+_stop_event = None
+
+
+def _init_worker(stop) -> None:
+    global _stop_event
+    _stop_event = stop
+
+
+def fix_high_bits(low_ok: Sequence[int], hpos: Sequence[int], hneg: Sequence[int],
+                  h: int, top: int) -> Tuple[List[int], List[int], List[int]]:
+    """Condiciona la CNF de bloques fijando las variables altas por encima de las h primeras.
+
+    Las variables altas h, h+1, ... toman los bits de `top`. Las cláusulas que quedan
+    satisfechas se eliminan y las demás conservan solo sus literales sobre las h variables
+    altas libres (los fijados en falso ya no aportan nada).
+    """
+    free = (1 << h) - 1
+    out_low: List[int] = []
+    out_pos: List[int] = []
+    out_neg: List[int] = []
+    for ok, p, q in zip(low_ok, hpos, hneg):
+        if (top & (p >> h)) | (~top & (q >> h)):
+            continue  # satisfecha por las variables fijadas
+        out_low.append(ok)
+        out_pos.append(p & free)
+        out_neg.append(q & free)
+    return out_low, out_pos, out_neg
+
+
+def _sweep_chunk(low_ok: Sequence[int], hpos: Sequence[int], hneg: Sequence[int],
+                 h: int, k: int, top: int) -> Tuple[int, int] | None:
+    """Tarea de un proceso: recorre los bloques con las variables altas >= h fijadas en `top`."""
+    low_ok, hpos, hneg = fix_high_bits(low_ok, hpos, hneg, h, top)
+    found = sweep_blocks(low_ok, hpos, hneg, h, k, _stop_event)
+    if found is None:
+        return None
+    block, t = found
+    if _stop_event is not None:
+        _stop_event.set()
+    return (top << h) | block, t
+
+
+def sweep_blocks_parallel(low_ok: Sequence[int], hpos: Sequence[int], hneg: Sequence[int],
+                          h: int, k: int, jobs: int) -> Tuple[int, int] | None:
+    """Como sweep_blocks, pero repartiendo los 2^h bloques entre `jobs` procesos.
+
+    Se fijan las p variables altas superiores (2^p >= jobs) y cada uno de los 2^p trozos
+    se recorre en un proceso aparte. El primero que encuentra un modelo activa un Event
+    compartido; los demás lo consultan periódicamente y terminan.
+    """
+    p = min(h, (jobs - 1).bit_length())
+    stop = multiprocessing.Event()
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(stop,)) as pool:
+        pending = {pool.submit(_sweep_chunk, low_ok, hpos, hneg, h - p, k, top)
+                   for top in range(1 << p)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                found = future.result()
+                if found is not None:
+                    stop.set()
+                    for other in pending:
+                        other.cancel()
+                    return found
+    return None
+
+
 # -------------------------------
 # Algoritmo de fuerza bruta
 # -------------------------------
 
-def bruteforce_sat(cnf: CNF) -> Tuple[bool, Assignment]:
+def bruteforce_sat(cnf: IntCNF, jobs: int | None = None) -> Tuple[bool, IntAssignment]:
     """Resuelve SAT por enumeración exhaustiva.
 
     Entrada:
-        cnf: fórmula en forma clausal (lista de cláusulas; cada cláusula es un set/lista de literales).
+        cnf: fórmula en forma clausal con literales enteros (ver to_dimacs);
+             cada cláusula es un set/lista de literales.
+        jobs: procesos a usar si la enumeración es grande (None = os.cpu_count()).
 
     Salida:
         (False, {}) si la CNF es insatisfacible.
-        (True,  I ) si la CNF es satisfacible, con I un diccionario {variable: bool}.
+        (True,  I ) si la CNF es satisfacible, con I un diccionario {id de variable: bool}.
 
     Casos límite tratados:
     - CNF vacía (sin cláusulas): True con asignación vacía (fórmula "verdadera" por convención).
@@ -165,27 +500,63 @@ def bruteforce_sat(cnf: CNF) -> Tuple[bool, Assignment]:
 
     vars_list = variables_from_cnf(cnf)
     n = len(vars_list)
-
-    # Enumerar TODAS las asignaciones posibles de n variables (2^n combinaciones)
-    for values in itertools.product([False, True], repeat=n):
-        I = dict(zip(vars_list, values))
-        if eval_cnf(cnf, I):
-            return True, I
+    pos, neg = build_clause_masks(cnf, vars_list)
+
+    # Enumerar TODAS las asignaciones posibles de n variables (2^n combinaciones).
+    # Cada asignación es un entero de n bits (a = bloque * 2^k + t): las k variables
+    # bajas se evalúan en paralelo, un bit por asignación del bloque (bitslicing), y
+    # solo se itera en Python sobre los 2^(n-k) valores de las variables altas.
+    k = min(n, LANE_BITS)
+    low_ok = bitslice_low(pos, neg, k)
+    hpos = [p >> k for p in pos]
+    hneg = [q >> k for q in neg]
+    jobs = jobs or os.cpu_count() or 1
+    if jobs > 1 and n - k >= PARALLEL_MIN_HIGH_BITS:
+        found = sweep_blocks_parallel(low_ok, hpos, hneg, n - k, k, jobs)
+    else:
+        found = sweep_blocks(low_ok, hpos, hneg, n - k, k)
+    if found is not None:
+        block, t = found
+        return True, unpack_assignment((block << k) | t, vars_list)
 
     # Ninguna asignación satisfizo la fórmula
     return False, {}
 
 
+# -------------------------------
+# Backend externo opcional (PySAT)
+# -------------------------------
+
+def solve_with_pysat(cnf: IntCNF) -> Tuple[bool, IntAssignment]:
+    """Resuelve la CNF (ya en enteros estilo DIMACS) con Glucose 4 vía PySAT.
+
+    Es un solver CDCL en C++, órdenes de magnitud más rápido que la enumeración.
+    Es opcional (--fast): requiere `pip install python-sat`; si no está instalado
+    lanza ImportError. Devuelve lo mismo que bruteforce_sat: (False, {}) o (True, {id: bool}).
+    """
+    from pysat.solvers import Glucose4
+
+    if any(len(c) == 0 for c in cnf):
+        return False, {}
+    with Glucose4(bootstrap_with=[list(c) for c in cnf]) as solver:
+        if not solver.solve():
+            return False, {}
+        return True, {abs(l): l > 0 for l in solver.get_model()}
+
+
 # -------------------------------
 # CLI (interfaz de línea de comandos)
 # -------------------------------
 
-def _load_cnf_from_json_like(obj: Iterable[Iterable[str]]) -> CNF:
-    """Convierte una estructura tipo JSON (lista de listas de strings) a la representación interna (List[Set[str]])."""
+def _load_cnf_from_json_like(obj: Iterable[Iterable[str]]) -> Tuple[IntCNF, List[str]]:
+    """Convierte una estructura tipo JSON (lista de listas de strings) a la representación interna
+    (List[Set[int]], estilo DIMACS) junto con los nombres de las variables (ver to_dimacs)."""
     cnf: CNF = []
     for clause in obj:
-        cnf.append(set(clause))
-    return cnf
+        # Internar cada literal: las comparaciones y búsquedas en sets/dicts de strings
+        # repetidos pasan a ser comparaciones de puntero.
+        cnf.append({sys.intern(l) for l in clause})
+    return to_dimacs(cnf)
 
 
 def main(argv: Sequence[str] | None = None) -> int:
@@ -196,6 +567,10 @@ def main(argv: Sequence[str] | None = None) -> int:
     g.add_argument("--input", "-i", type=str, help="Ruta a archivo JSON con la CNF (lista de listas de literales).")
     g.add_argument("--expr", "-e", type=str, help="CNF en JSON inline. Ej.: '[[\"p\",\"q\"],[\"~p\",\"r\"]]'")
 
+    parser.add_argument("--jobs", "-j", type=int, default=None,
+                        help="Procesos para repartir la enumeración (por defecto, todos los núcleos).")
+    parser.add_argument("--fast", action="store_true",
+                        help="Resolver con un solver CDCL externo (PySAT/Glucose4) en lugar del algoritmo en Python.")
     args = parser.parse_args(argv)
 
     # Leer CNF según el origen elegido
@@ -208,14 +583,19 @@ def main(argv: Sequence[str] | None = None) -> int:
         # Leer desde stdin
         data = json.load(sys.stdin)
 
-    cnf = _load_cnf_from_json_like(data)
+    cnf, var_names = _load_cnf_from_json_like(data)
 
-    sat, model = bruteforce_sat(cnf)
-    out = {"satisfiable": sat, "assignment": model}
+    if args.fast:
+        try:
+            sat, I = solve_with_pysat(cnf)
+        except ImportError:
+            parser.error("--fast requiere el paquete python-sat (pip install python-sat).")
+    else:
+        sat, I = bruteforce_sat(cnf, args.jobs)
+    out = {"satisfiable": sat, "assignment": decode_model(I, var_names)}
     print(json.dumps(out, ensure_ascii=False, indent=2))
     return 0
 
 
 if __name__ == "__main__":
-    import sys
     raise SystemExit(main())
@@ -6,92 +6,433 @@ dpll.py — Programa 2 (Algoritmo DPLL sencillo) para SAT en forma clausal (CNF)
 Apegado al PDF “Algoritmo_DPLL.pdf”:
 - Caso base: B (CNF) vacía  → True y la asignación parcial I
 - Caso base: existe cláusula vacía en B → False y asignación vacía
+- Antes de ramificar (las dos "L" de DPLL):
+    * Propagación unitaria: toda cláusula con un solo literal libre (y el resto falsos)
+      obliga a hacer verdadero ese literal; se repite hasta que no haya más.
+    * Literales puros: si una variable aparece con una sola polaridad en las cláusulas
+      aún no satisfechas, se asigna para satisfacerlas (nunca estorba).
 - Seleccionar literal L **en forma positiva** ("pone en forma positiva")
 - Ramificar:
-    1) Asignar L=True, simplificar y llamar recursivo.
-    2) Si falla, asignar L=False (equivalente a afirmar ~L), simplificar y llamar recursivo.
+    1) Asignar L=True, simplificar y seguir (el PDF lo plantea como llamada recursiva;
+       aquí se usa una pila explícita de decisiones, ver _search).
+    2) Si falla, asignar L=False (equivalente a afirmar ~L), simplificar y seguir.
+  "Simplificar" no copia B: se usa el esquema de 2 literales vigilados (ver propagate),
+  que solo revisa las cláusulas que vigilan al literal que acaba de volverse falso.
 - Si ambas ramas fallan → False.
 
-Nota: DPLL es no determinista (la elección de L puede variar). Aquí usamos una
-heurística mínima: tomamos la **primera cláusula no vacía** y de ella el primer
-literal, pero devolviéndolo en forma **positiva** (su variable base).
+Nota: DPLL es no determinista (la elección de L puede variar). Aquí usamos la
+heurística de la **cláusula más corta** (entre las no satisfechas) y, dentro de ella,
+el literal con más peso Jeroslow-Wang; se devuelve en forma **positiva** (su variable
+base) junto con la polaridad que conviene probar primero.
+
+Representación interna (estilo DIMACS):
+- Cada variable recibe un entero 1..n; el literal "p" es +id(p) y "~p" es -id(p).
+- Cada cláusula es una tupla ordenada de enteros; negar un literal es cambiarle el signo.
+- La traducción desde/hacia strings se hace solo en los bordes (to_dimacs / decode_model),
+  así la búsqueda no paga hashing de strings ni `str.startswith` por literal.
 """
 
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import random
 import sys
-from typing import Dict, List, Set, Tuple, Sequence
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple, Sequence
 
 Literal = str
 Clause = Set[Literal]
 CNF     = List[Clause]
 Assignment = Dict[str, bool]
 
+Lit = int                       # +v ó -v  (v = 1..n)
+IntClause = Tuple[Lit, ...]     # p.ej. (-1, 3)
+IntCNF = List[IntClause]
+IntAssignment = Dict[int, bool]  # id de variable -> valor
+Values = List[Optional[bool]]    # durante la búsqueda: Values[v] = valor de v, o None si libre
+
 
 # -------------------------------
 # Utilidades
 # -------------------------------
 
+@functools.lru_cache(maxsize=None)
 def base_var(lit: Literal) -> str:
-    return lit[1:] if lit.startswith("~") else lit
+    return sys.intern(lit[1:]) if lit.startswith("~") else lit
 
 def is_negated(lit: Literal) -> bool:
     return lit.startswith("~")
 
-def negate(lit: Literal) -> Literal:
-    return base_var(lit) if is_negated(lit) else f"~{lit}"
+
+def to_dimacs(B: CNF) -> Tuple[IntCNF, List[str]]:
+    """
+    Traduce la CNF de strings a enteros estilo DIMACS.
+    Devuelve (cláusulas, var_names) donde var_names[v-1] es el nombre de la variable v.
+    """
+    var_names = sorted({base_var(l) for clause in B for l in clause})
+    index = {name: v for v, name in enumerate(var_names, start=1)}
+    clauses: IntCNF = []
+    for clause in B:
+        lits = {-index[base_var(l)] if is_negated(l) else index[base_var(l)] for l in clause}
+        clauses.append(tuple(sorted(lits)))
+    return clauses, var_names
+
+
+def decode_model(I: IntAssignment, var_names: Sequence[str]) -> Assignment:
+    """Traduce una asignación sobre ids de variable de vuelta a {nombre: bool}."""
+    return {var_names[v - 1]: val for v, val in I.items()}
 
 
 # -------------------------------
-# Simplificación B | L=True
+# Estado de la búsqueda
 # -------------------------------
+#
+# La CNF se guarda UNA vez y la búsqueda trabaja en sitio sobre ella:
+#   - vals[v]: valor actual de la variable v (None si está libre).
+#   - trail: pila de literales asignados, en orden; retroceder = desapilar.
+#   - occ[L]: índices de las cláusulas que contienen al literal L (ver build_occur).
+#   - live[L]: cuántas cláusulas NO satisfechas contienen al literal L.
+#   - sat_count[i]: cuántos literales de la cláusula i son verdaderos (0 = no satisfecha).
+#   - free_count[i]: cuántos literales de la cláusula i siguen libres.
+#   - num_unsat: cuántas cláusulas tienen sat_count == 0.
+#   - chash[i], key: huella incremental de la fórmula residual (ver residual_key).
+# Los contadores se actualizan al asignar y se revierten al retroceder, así que
+# "¿está satisfecha la cláusula?" y "¿están todas satisfechas?" cuestan O(1), sin
+# reconstruir B ni recorrer sus literales, y encontrar literales puros cuesta O(n)
+# (mirar live[v] y live[-v] de cada variable libre) en lugar de recorrer toda la CNF.
+#
+# La propagación unitaria usa 2 literales vigilados: cada cláusula "vigila" dos literales
+# no falsos, los de las posiciones 0 y 1 de db[i]. watches[L] lista las cláusulas que
+# vigilan a L. Al hacer L verdadero solo hay que revisar las que vigilan a -L:
+#   - si encuentran otro literal no falso, lo pasan a vigilar;
+#   - si no, y el otro vigilado es falso → conflicto;
+#   - si no, y el otro vigilado está libre → cláusula unitaria: se asigna.
+# Al retroceder no hay que deshacer nada en los vigilados (siguen siendo válidos).
+
+@dataclass
+class SearchState:
+    db: List[List[Lit]]
+    watches: Dict[Lit, List[int]]
+    occ: Dict[Lit, List[int]]
+    vals: Values
+    trail: List[Lit] = field(default_factory=list)
+    sat_count: List[int] = field(default_factory=list)
+    free_count: List[int] = field(default_factory=list)
+    num_unsat: int = 0
+    live: Dict[Lit, int] = field(default_factory=dict)
+    zobrist: Dict[Lit, int] = field(default_factory=dict)
+    chash: List[int] = field(default_factory=list)
+    key: int = 0
+    failed: Set[int] = field(default_factory=set)
+
+
+def lit_value(L: Lit, I: Values) -> bool | None:
+    """Valor del literal L bajo I: True, False, o None si su variable no está asignada."""
+    v = I[abs(L)]
+    if v is None:
+        return None
+    return v if L > 0 else not v
+
+
+def build_occur(B: IntCNF) -> Tuple[Dict[int, List[int]], Dict[int, List[int]]]:
+    """
+    Índices de ocurrencia, armados una sola vez: occ_pos[v] / occ_neg[v] son los índices
+    de las cláusulas que contienen +v / -v. Con ellos, "¿qué cláusulas tocan a L?" es una
+    búsqueda en un diccionario en lugar de recorrer toda la CNF.
+    """
+    occ_pos: Dict[int, List[int]] = {}
+    occ_neg: Dict[int, List[int]] = {}
+    for v in {abs(l) for c in B for l in c}:
+        occ_pos[v] = []
+        occ_neg[v] = []
+    for ci, c in enumerate(B):
+        for l in c:
+            (occ_pos if l > 0 else occ_neg)[abs(l)].append(ci)
+    return occ_pos, occ_neg
+
+
+def build_state(B: IntCNF, n: int) -> SearchState:
+    """
+    Copia las cláusulas a listas mutables (db) y arma vigilados, ocurrencias y contadores
+    para variables 1..n. Las cláusulas de un solo literal no se vigilan: se asignan
+    directamente en dpll.
+    """
+    db: List[List[Lit]] = [list(c) for c in B]
+    occ_pos, occ_neg = build_occur(B)
+    occ: Dict[Lit, List[int]] = {}
+    watches: Dict[Lit, List[int]] = {}
+    for v in occ_pos:
+        occ[v] = occ_pos[v]
+        occ[-v] = occ_neg[v]
+        watches[v] = []
+        watches[-v] = []
+    for ci, c in enumerate(db):
+        if len(c) >= 2:
+            watches[c[0]].append(ci)
+            watches[c[1]].append(ci)
+    # Semilla fija: la huella (y por tanto la búsqueda) es reproducible entre corridas
+    rng = random.Random(0)
+    zobrist = {l: rng.getrandbits(64) for l in sorted(occ)}
+    chash = [functools.reduce(int.__xor__, (zobrist[l] for l in c), 0) for c in db]
+    return SearchState(
+        db=db,
+        watches=watches,
+        occ=occ,
+        live={l: len(cs) for l, cs in occ.items()},
+        zobrist=zobrist,
+        chash=chash,
+        key=sum(chash) & HASH_MASK,
+        vals=[None] * (n + 1),
+        sat_count=[0] * len(db),
+        free_count=[len(c) for c in db],
+        num_unsat=len(db),
+    )
+
+
+def assign(S: SearchState, L: Lit) -> None:
+    """Hace verdadero el literal L, lo registra en el trail y actualiza los contadores."""
+    S.vals[abs(L)] = L > 0
+    S.trail.append(L)
+    sat_count, free_count, live, chash = S.sat_count, S.free_count, S.live, S.chash
+    key = S.key
+    zl, zn = S.zobrist.get(L, 0), S.zobrist.get(-L, 0)
+    for ci in S.occ.get(L, ()):
+        if sat_count[ci] == 0:
+            S.num_unsat -= 1
+            key -= chash[ci]  # la cláusula sale de la residual
+            for x in S.db[ci]:
+                live[x] -= 1
+        sat_count[ci] += 1
+        free_count[ci] -= 1
+        chash[ci] ^= zl
+    for ci in S.occ.get(-L, ()):
+        free_count[ci] -= 1
+        h = chash[ci]
+        chash[ci] = h ^ zn
+        if sat_count[ci] == 0:
+            key += (h ^ zn) - h  # pierde el literal -L
+    S.key = key & HASH_MASK
+
+
+def backtrack(S: SearchState, size: int) -> None:
+    """Deshace las asignaciones del trail (y sus contadores) hasta dejarlo con `size` elementos."""
+    sat_count, free_count, live, chash = S.sat_count, S.free_count, S.live, S.chash
+    key = S.key
+    while len(S.trail) > size:
+        L = S.trail.pop()
+        S.vals[abs(L)] = None
+        zl, zn = S.zobrist.get(L, 0), S.zobrist.get(-L, 0)
+        for ci in S.occ.get(L, ()):
+            chash[ci] ^= zl
+            sat_count[ci] -= 1
+            if sat_count[ci] == 0:
+                S.num_unsat += 1
+                key += chash[ci]  # la cláusula vuelve a la residual
+                for x in S.db[ci]:
+                    live[x] += 1
+            free_count[ci] += 1
+        for ci in S.occ.get(-L, ()):
+            h = chash[ci]
+            chash[ci] = h ^ zn
+            if sat_count[ci] == 0:
+                key += (h ^ zn) - h  # recupera el literal -L
+            free_count[ci] += 1
+    S.key = key & HASH_MASK
+
+
+def propagate(S: SearchState, head: int) -> bool:
+    """
+    Propagación unitaria a partir de trail[head:].
+    Devuelve False si aparece un conflicto (una cláusula con todos sus literales falsos).
+    """
+    db, watches, I, trail = S.db, S.watches, S.vals, S.trail
+    while head < len(trail):
+        false_lit = -trail[head]
+        head += 1
+        ws = watches.get(false_lit)
+        if not ws:
+            continue  # variable ajena a la CNF (p.ej. venía en la I inicial)
+        i = 0
+        while i < len(ws):
+            c = db[ws[i]]
+            # Dejar el literal que se volvió falso en la posición 1
+            if c[0] == false_lit:
+                c[0], c[1] = c[1], c[0]
+            other = c[0]
+            if lit_value(other, I) is True:
+                i += 1
+                continue  # la cláusula ya está satisfecha
+            # Buscar un reemplazo no falso para vigilar
+            for k in range(2, len(c)):
+                if lit_value(c[k], I) is not False:
+                    c[1], c[k] = c[k], c[1]
+                    watches[c[1]].append(ws[i])
+                    ws[i] = ws[-1]
+                    ws.pop()
+                    break
+            else:
+                if lit_value(other, I) is False:
+                    return False  # conflicto
+                assign(S, other)  # cláusula unitaria
+                i += 1
+    return True
+
+
+def pure_literals(S: SearchState) -> List[Lit]:
+    """
+    Literales libres que aparecen con una sola polaridad en las cláusulas aún no
+    satisfechas. Hacerlos verdaderos solo puede satisfacer cláusulas, nunca falsificarlas.
+    """
+    live = S.live
+    pure: List[Lit] = []
+    for v, val in enumerate(S.vals):
+        if val is not None or v not in live:
+            continue  # asignada (o ajena a la CNF)
+        pos, neg = live[v], live[-v]
+        if pos and not neg:
+            pure.append(v)
+        elif neg and not pos:
+            pure.append(-v)
+    return pure
+
 
-def simplify(B: CNF, L: Literal) -> CNF:
+# -------------------------------
+# Selección de literal (positiva)
+# -------------------------------
+
+def pick_literal_positive(S: SearchState) -> Tuple[Lit, bool]:
     """
-    Simplifica la CNF B asumiendo que el literal L es VERDADERO:
-      - Elimina todas las cláusulas que contienen L (ya satisfechas).
-      - En el resto, elimina la ocurrencia de ~L.
+    Heurística de la cláusula más corta + Jeroslow-Wang:
+      1) Entre las cláusulas aún no satisfechas, tomar la de menos literales libres.
+      2) Dentro de ella, elegir la variable con mayor puntaje JW(v) + JW(~v), donde
+         JW(l) = suma de 2^-|c| sobre las cláusulas no satisfechas c que contienen l
+         (|c| = literales libres de c): pesan más las ocurrencias en cláusulas cortas.
+    Devuelve (variable en forma positiva, valor a probar primero): se prueba primero
+    la polaridad con mayor puntaje. Devuelve (0, True) si todas las cláusulas están
+    satisfechas.
     """
-    comp = negate(L)
-    new_B: CNF = []
-    for clause in B:
-        if L in clause:
+    I = S.vals
+    jw: Dict[Lit, float] = {}
+    shortest = -1
+    for ci, clause in enumerate(S.db):
+        if S.sat_count[ci]:
             continue  # satisfecha
-        if comp in clause:
-            c2 = set(clause)
-            c2.remove(comp)
-            new_B.append(c2)
-        else:
-            new_B.append(set(clause))
-    return new_B
+        size = S.free_count[ci]
+        weight = 2.0 ** -size
+        for l in clause:
+            if I[abs(l)] is None:
+                jw[l] = jw.get(l, 0.0) + weight
+        if shortest < 0 or size < S.free_count[shortest]:
+            shortest = ci
+    if shortest < 0:
+        return 0, True
+
+    free = [l for l in S.db[shortest] if I[abs(l)] is None]
+    best = max(free, key=lambda l: jw.get(l, 0.0) + jw.get(-l, 0.0))
+    v = abs(best)
+    return v, jw.get(v, 0.0) >= jw.get(-v, 0.0)
 
 
 # -------------------------------
-# Selección de literal (positiva)
+# Memoización de subproblemas fallidos
 # -------------------------------
 
-def pick_literal_positive(B: CNF, I: Assignment) -> Literal:
+# Fórmulas residuales con menos cláusulas que esto no se memorizan: resolverlas de
+# nuevo es casi inmediato y solo llenarían la memoria.
+MEMO_MIN_CLAUSES = 8
+# Tope de entradas en la memoria (para no crecer sin límite en búsquedas largas).
+MEMO_MAX_ENTRIES = 100_000
+# Las huellas se llevan módulo 2^64
+HASH_MASK = (1 << 64) - 1
+
+
+def residual_key(S: SearchState) -> int | None:
     """
-    Devuelve el nombre de variable (literal positivo) a partir de la primera cláusula no vacía.
-    Mantiene la sencillez pedida por el PDF y la indicación de “poner en forma positiva”.
+    Huella (estilo Zobrist) de la fórmula residual B|I: cada literal tiene un entero
+    aleatorio de 64 bits, chash[i] es el XOR de los literales libres de la cláusula i,
+    y la huella es la suma módulo 2^64 de chash sobre las cláusulas no satisfechas.
+    assign/backtrack la mantienen al día tocando solo las cláusulas de L y -L, así que
+    leerla cuesta O(1). Dos caminos que llegan a la misma residual (como multiconjunto
+    de cláusulas reducidas) tienen la misma huella; una colisión entre residuales
+    distintas es posible pero con probabilidad del orden de 2^-64 por par.
+    Devuelve None si la residual es chica.
     """
-    for clause in B:
-        if len(clause) == 0:
-            continue
-        # primer literal de la cláusula → devolver su variable base en forma positiva
-        raw = next(iter(clause))
-        return base_var(raw)
-    # fallback (no debería ocurrir si se llama correctamente)
-    return "p"
+    if S.num_unsat < MEMO_MIN_CLAUSES:
+        return None
+    return S.key
 
 
 # -------------------------------
-# DPLL recursivo
+# DPLL iterativo
 # -------------------------------
+#
+# En lugar de recursión, una pila explícita de decisiones. Cada marco guarda:
+#   (literal de la rama que falta probar, o 0 si ya se probaron ambas,
+#    largo del trail antes de la decisión, huella de la residual para la memoización)
+# Ante un conflicto se desapilan marcos hasta uno con rama pendiente, se restaura el
+# trail a su largo y se afirma el literal contrario. No hay una llamada de Python por
+# decisión ni riesgo de RecursionError en instancias profundas.
+
+Frame = Tuple[Lit, int, Optional[int]]
+
+
+def _search(S: SearchState) -> bool:
+    stack: List[Frame] = []
+    head = 0
+    while True:
+        # Propagación unitaria de lo asignado desde trail[head:]
+        ok = propagate(S, head)
+        if ok:
+            # Eliminación de literales puros (puede destapar nuevos puros: repetir).
+            # Se propagan para mantener válidos los vigilados; no pueden producir conflicto.
+            pure = pure_literals(S)
+            while pure:
+                mark = len(S.trail)
+                for l in pure:
+                    assign(S, l)
+                propagate(S, mark)
+                pure = pure_literals(S)
+
+            # Caso: todas las cláusulas satisfechas
+            if S.num_unsat == 0:
+                return True
+
+            # Si esta misma fórmula residual ya fracasó por otro camino, no repetir la
+            # búsqueda. (Solo se guardan fracasos: si una residual fuera satisfacible, la
+            # búsqueda ya habría terminado con éxito.)
+            key = residual_key(S)
+            if key is None or key not in S.failed:
+                # Elegir literal L en forma positiva (variable base) y el valor a probar primero
+                L, first = pick_literal_positive(S)    # e.g. (1, True)  (variable "p")
+
+                # Rama con el valor preferido; la contraria queda pendiente en la pila
+                # (L = True ↔ afirmar L, L = False ↔ afirmar "~p", es decir -L)
+                lit = L if first else -L
+                head = len(S.trail)
+                stack.append((-lit, head, key))
+                assign(S, lit)
+                continue
+
+        # Conflicto (o residual ya fracasada): retroceder hasta una rama pendiente
+        while stack:
+            alt, mark, key = stack[-1]
+            backtrack(S, mark)
+            if alt:
+                stack[-1] = (0, mark, key)
+                assign(S, alt)
+                head = mark
+                break
+            # Ambas ramas fallaron: recordar la residual y seguir retrocediendo
+            stack.pop()
+            if key is not None and len(S.failed) < MEMO_MAX_ENTRIES:
+                S.failed.add(key)
+        else:
+            return False
 
-def dpll(B: CNF, I: Assignment) -> Tuple[bool, Assignment]:
+
+def dpll(B: IntCNF, I: IntAssignment) -> Tuple[bool, IntAssignment]:
     # Caso 1: fórmula vacía → satisfecha
     if len(B) == 0:
         return True, I
@@ -100,36 +441,64 @@ def dpll(B: CNF, I: Assignment) -> Tuple[bool, Assignment]:
     if any(len(c) == 0 for c in B):
         return False, {}
 
-    # Elegir literal L en forma positiva (variable base)
-    L = pick_literal_positive(B, I)     # e.g. "p"
+    # Un solo estado mutable para toda la búsqueda: cada rama escribe en él y backtrack
+    # lo restaura desde el trail, así que ninguna rama copia I ni B.
+    n = max([abs(l) for c in B for l in c] + list(I))
+    S = build_state(B, n)
+    for v, val in I.items():
+        assign(S, v if val else -v)
+
+    # Las cláusulas unitarias no se vigilan: se afirman antes de empezar
+    for c in S.db:
+        if len(c) == 1:
+            val = lit_value(c[0], S.vals)
+            if val is False:
+                return False, {}
+            if val is None:
+                assign(S, c[0])
+
+    if not _search(S):
+        return False, {}
+    # Solo aquí, al encontrar un modelo, se arma el diccionario de salida
+    return True, {abs(l): l > 0 for l in S.trail}
 
-    # Rama L = True
-    I_true = dict(I)
-    I_true[L] = True
-    B_true = simplify(B, L)             # afirma "p"
-    sat, model = dpll(B_true, I_true)
-    if sat:
-        return True, model
 
-    # Rama L = False  (equivale a afirmar "~p")
-    I_false = dict(I)
-    I_false[L] = False
-    B_false = simplify(B, f"~{L}")
-    return dpll(B_false, I_false)
+# -------------------------------
+# Backend externo opcional (PySAT)
+# -------------------------------
+
+def solve_with_pysat(B: IntCNF) -> Tuple[bool, IntAssignment]:
+    """
+    Resuelve la CNF (ya en enteros estilo DIMACS) con Glucose 4 vía PySAT, un solver
+    CDCL en C++ mucho más rápido que la búsqueda en Python. Es opcional (--fast):
+    requiere `pip install python-sat`; si no está instalado lanza ImportError.
+    Devuelve lo mismo que dpll: (False, {}) o (True, {id: bool}).
+    """
+    from pysat.solvers import Glucose4
+
+    if any(len(c) == 0 for c in B):
+        return False, {}
+    with Glucose4(bootstrap_with=[list(c) for c in B]) as solver:
+        if not solver.solve():
+            return False, {}
+        return True, {abs(l): l > 0 for l in solver.get_model()}
 
 
 # -------------------------------
 # CLI
 # -------------------------------
 
-def _load_cnf_from_json_like(obj) -> CNF:
-    return [set(clause) for clause in obj]
+def _load_cnf_from_json_like(obj) -> Tuple[IntCNF, List[str]]:
+    # Literales internados: los strings repetidos se comparan por puntero
+    return to_dimacs([{sys.intern(l) for l in clause} for clause in obj])
 
 def main(argv: Sequence[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Programa 2 — SAT con DPLL sencillo (CNF).")
     g = parser.add_mutually_exclusive_group()
     g.add_argument("--input", "-i", type=str, help="Ruta a archivo JSON con la CNF (lista de listas).")
     g.add_argument("--expr", "-e",  type=str, help="CNF en JSON inline. Ej.: '[[\"p\",\"q\"],[\"~p\",\"r\"]]'")
+    parser.add_argument("--fast", action="store_true",
+                        help="Resolver con un solver CDCL externo (PySAT/Glucose4) en lugar del algoritmo en Python.")
     args = parser.parse_args(argv)
 
     # cargar datos
@@ -141,9 +510,16 @@ def main(argv: Sequence[str] | None = None) -> int:
     else:
         data = json.load(sys.stdin)
 
-    B = _load_cnf_from_json_like(data)
+    clauses, var_names = _load_cnf_from_json_like(data)
 
-    sat, model = dpll(B, {})
+    if args.fast:
+        try:
+            sat, I = solve_with_pysat(clauses)
+        except ImportError:
+            parser.error("--fast requiere el paquete python-sat (pip install python-sat).")
+    else:
+        sat, I = dpll(clauses, {})
+    model = decode_model(I, var_names)
     print(json.dumps({"satisfiable": sat, "assignment": model}, ensure_ascii=False, indent=2))
     return 0
 